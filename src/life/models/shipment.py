@@ -4,6 +4,10 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+ShipmentStatus = Literal[
+    "pending", "in_transit", "out_for_delivery", "delivered", "exception", "unknown"
+]
+
 
 class TrackingEvent(BaseModel):
     timestamp: datetime
@@ -18,7 +22,7 @@ class Shipment(BaseModel):
     tracking_number: str
     tracking_url: str | None = None
     description: str = ""
-    status: Literal["pending", "in_transit", "out_for_delivery", "delivered", "exception", "unknown"] = "unknown"
+    status: ShipmentStatus = "unknown"
     eta: datetime | None = None
     source_email_subject: str | None = None
     history: list[TrackingEvent] = Field(default_factory=list)
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from life.auth import verify_auth
 from life.models.shipment import Shipment
+from life.services.tracking import fetch_tracking_status
 from life.storage import database
 
 router = APIRouter()
@@ -45,6 +46,17 @@ async def add_shipment(
     return RedirectResponse(url="/shipments", status_code=303)
 
 
+@router.post("/{shipment_id}/refresh")
+async def refresh_shipment(shipment_id: str, _: None = Depends(verify_auth)):
+    """Refresh tracking status for a shipment."""
+    shipment = database.load("shipments", shipment_id, Shipment)
+    if shipment:
+        result = await fetch_tracking_status(shipment)
+        if result:
+            database.save("shipments", result)
+    return RedirectResponse(url="/shipments", status_code=303)
+
+
 @router.post("/{shipment_id}/archive")
 async def archive_shipment(shipment_id: str, _: None = Depends(verify_auth)):
     """Archive a shipment."""
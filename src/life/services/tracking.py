@@ -1,18 +1,72 @@
+import asyncio
 import logging
 from datetime import datetime, timezone
 
 import httpx
 
 from life.config import settings
-from life.models.shipment import Shipment, TrackingEvent
+from life.models.shipment import Shipment, ShipmentStatus, TrackingEvent
+from life.services import tracking_cache
 
 logger = logging.getLogger(__name__)
 
 SHIP24_API_URL = "https://api.ship24.com/public/v1"
 
+# Ship24 lookups currently running, so concurrent requests for the same
+# tracking number share one API call
+_in_flight: dict[str, asyncio.Task] = {}
+
 
 async def fetch_tracking_status(shipment: Shipment) -> Shipment | None:
-    """Fetch latest tracking status for a shipment using Ship24 API."""
+    """Fetch latest tracking status for a shipment, served from cache when fresh."""
+    tracking_number = shipment.tracking_number
+    try:
+        tracking = tracking_cache.get(tracking_number)
+    except Exception as e:
+        logger.exception(f"Error reading tracking cache: {e}")
+        tracking = None
+
+    if tracking is None:
+        task = _in_flight.get(tracking_number)
+        if task is None:
+            task = asyncio.create_task(_fetch_and_cache(tracking_number))
+            _in_flight[tracking_number] = task
+            task.add_done_callback(lambda _: _in_flight.pop(tracking_number, None))
+        tracking = await asyncio.shield(task)
+
+    if tracking is None:
+        return None
+
+    try:
+        return _apply_tracking(shipment, tracking)
+    except Exception as e:
+        logger.exception(f"Error applying tracking: {e}")
+        return None
+
+
+async def _fetch_and_cache(tracking_number: str) -> dict | None:
+    """Fetch tracking results from Ship24 and store them in the cache."""
+    tracking = await _fetch_ship24_tracking(tracking_number)
+    if tracking is None:
+        return None
+
+    # Apply to a throwaway shipment so malformed payloads never reach the cache
+    try:
+        probe = Shipment(carrier="other", tracking_number=tracking_number)
+        _apply_tracking(probe, tracking)
+    except Exception as e:
+        logger.exception(f"Error parsing tracking: {e}")
+        return None
+
+    try:
+        tracking_cache.put(tracking_number, probe.status, tracking)
+    except Exception as e:
+        logger.exception(f"Error caching tracking: {e}")
+    return tracking
+
+
+async def _fetch_ship24_tracking(tracking_number: str) -> dict | None:
+    """Fetch the raw Ship24 tracking result for a tracking number."""
     if not settings.ship24_api_key:
         logger.warning("No Ship24 API key configured")
         return None
@@ -27,14 +81,14 @@ async def fetch_tracking_status(shipment: Shipment) -> Shipment | None:
             # First, ensure tracker exists
             await client.post(
                 f"{SHIP24_API_URL}/trackers",
-                json={"trackingNumber": shipment.tracking_number},
+                json={"trackingNumber": tracking_number},
                 headers=headers,
                 timeout=30.0,
             )
 
             # Get tracking results
             response = await client.get(
-                f"{SHIP24_API_URL}/trackers/search/{shipment.tracking_number}/results",
+                f"{SHIP24_API_URL}/trackers/search/{tracking_number}/results",
                 headers=headers,
                 timeout=30.0,
             )
@@ -49,91 +103,100 @@ async def fetch_tracking_status(shipment: Shipment) -> Shipment | None:
             if not trackings:
                 return None
 
-            tracking = trackings[0]
-            ship = tracking.get("shipment", {})
-            events = tracking.get("events", [])
-
-            # Update status based on statusMilestone
-            milestone = ship.get("statusMilestone", "").lower()
-            if milestone == "delivered":
-                shipment.status = "delivered"
-            elif milestone == "out_for_delivery":
-                shipment.status = "out_for_delivery"
-            elif milestone == "in_transit":
-                shipment.status = "in_transit"
-            elif milestone == "info_received":
-                shipment.status = "pending"
-            elif milestone == "exception" or milestone == "failed_attempt":
-                shipment.status = "exception"
-            else:
-                shipment.status = "unknown"
-
-            # Update ETA
-            delivery = ship.get("delivery", {})
-            eta_str = delivery.get("estimatedDeliveryDate")
-            if eta_str:
-                try:
-                    shipment.eta = datetime.fromisoformat(eta_str.replace("Z", "+00:00"))
-                except ValueError:
-                    pass
-
-            # Update carrier from Ship24's detection
-            courier_code = None
-            if events:
-                courier_code = events[0].get("courierCode", "")
-
-            if courier_code:
-                carrier_map = {
-                    "us-post": "usps",
-                    "ups": "ups",
-                    "fedex": "fedex",
-                    "dhl": "dhl",
-                }
-                shipment.carrier = carrier_map.get(courier_code, shipment.carrier)
-
-            # Set tracking URL
-            shipment.tracking_url = _get_tracking_url(shipment.carrier, shipment.tracking_number)
-
-            # Update description with service type
-            service = delivery.get("service")
-            if service and not shipment.description:
-                shipment.description = service
-
-            # Convert events to history
-            new_history = []
-            for event in events:
-                event_time = event.get("datetime")
-                if event_time:
-                    try:
-                        timestamp = datetime.fromisoformat(event_time.replace("Z", "+00:00"))
-                    except ValueError:
-                        timestamp = datetime.now(timezone.utc)
-                else:
-                    timestamp = datetime.now(timezone.utc)
-
-                location = event.get("location") or ""
-                status_text = event.get("status", "")
-                description = f"{status_text} - {location}".strip(" -")
-
-                new_history.append(
-                    TrackingEvent(
-                        timestamp=timestamp,
-                        description=description,
-                        location=location,
-                        status=event.get("statusMilestone") or shipment.status,
-                    )
-                )
-
-            if new_history:
-                shipment.history = new_history
-
-            return shipment
+            return trackings[0]
 
     except Exception as e:
         logger.exception(f"Error fetching tracking: {e}")
         return None
 
 
+def _map_milestone(milestone: str) -> ShipmentStatus:
+    """Map a Ship24 statusMilestone to a shipment status."""
+    milestone = milestone.lower()
+    if milestone == "delivered":
+        return "delivered"
+    elif milestone == "out_for_delivery":
+        return "out_for_delivery"
+    elif milestone == "in_transit":
+        return "in_transit"
+    elif milestone == "info_received":
+        return "pending"
+    elif milestone == "exception" or milestone == "failed_attempt":
+        return "exception"
+    else:
+        return "unknown"
+
+
+def _apply_tracking(shipment: Shipment, tracking: dict) -> Shipment:
+    """Update a shipment from a Ship24 tracking result."""
+    ship = tracking.get("shipment", {})
+    events = tracking.get("events", [])
+
+    # Update status based on statusMilestone
+    shipment.status = _map_milestone(ship.get("statusMilestone", ""))
+
+    # Update ETA
+    delivery = ship.get("delivery", {})
+    eta_str = delivery.get("estimatedDeliveryDate")
+    if eta_str:
+        try:
+            shipment.eta = datetime.fromisoformat(eta_str.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+
+    # Update carrier from Ship24's detection
+    courier_code = None
+    if events:
+        courier_code = events[0].get("courierCode", "")
+
+    if courier_code:
+        carrier_map = {
+            "us-post": "usps",
+            "ups": "ups",
+            "fedex": "fedex",
+            "dhl": "dhl",
+        }
+        shipment.carrier = carrier_map.get(courier_code, shipment.carrier)
+
+    # Set tracking URL
+    shipment.tracking_url = _get_tracking_url(shipment.carrier, shipment.tracking_number)
+
+    # Update description with service type
+    service = delivery.get("service")
+    if service and not shipment.description:
+        shipment.description = service
+
+    # Convert events to history
+    new_history = []
+    for event in events:
+        event_time = event.get("datetime")
+        if event_time:
+            try:
+                timestamp = datetime.fromisoformat(event_time.replace("Z", "+00:00"))
+            except ValueError:
+                timestamp = datetime.now(timezone.utc)
+        else:
+            timestamp = datetime.now(timezone.utc)
+
+        location = event.get("location") or ""
+        status_text = event.get("status", "")
+        description = f"{status_text} - {location}".strip(" -")
+
+        new_history.append(
+            TrackingEvent(
+                timestamp=timestamp,
+                description=description,
+                location=location,
+                status=event.get("statusMilestone") or shipment.status,
+            )
+        )
+
+    if new_history:
+        shipment.history = new_history
+
+    return shipment
+
+
 def _get_tracking_url(carrier: str, tracking_number: str) -> str:
     """Get carrier tracking URL."""
     urls = {
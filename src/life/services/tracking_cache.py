@@ -0,0 +1,62 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from life.models.shipment import ShipmentStatus
+from life.storage import database
+
+# How long a Ship24 result stays fresh, by the shipment status it maps to.
+# Active statuses stay under the hourly poll interval so the poller still
+# picks up new events; delivered shipments rarely change again.
+TTL_BY_STATUS: dict[ShipmentStatus, timedelta] = {
+    "pending": timedelta(minutes=30),
+    "in_transit": timedelta(minutes=30),
+    "out_for_delivery": timedelta(minutes=10),
+    "exception": timedelta(minutes=15),
+    "unknown": timedelta(minutes=15),
+    "delivered": timedelta(hours=24),
+}
+MAX_ENTRIES = 500
+
+
+def get(tracking_number: str) -> dict | None:
+    """Get a fresh cached tracking result, or None if missing or expired."""
+    now = datetime.now(timezone.utc).isoformat()
+
+    with database.get_connection() as conn:
+        row = conn.execute(
+            "SELECT data FROM tracking_cache WHERE tracking_number = ? AND expires_at > ?",
+            (tracking_number, now),
+        ).fetchone()
+        if not row:
+            return None
+
+        conn.execute(
+            "UPDATE tracking_cache SET accessed_at = ? WHERE tracking_number = ?",
+            (now, tracking_number),
+        )
+        conn.commit()
+        return json.loads(row["data"])
+
+
+def put(tracking_number: str, status: ShipmentStatus, data: dict) -> None:
+    """Cache a tracking result and evict least recently used entries over the limit."""
+    now = datetime.now(timezone.utc)
+    expires_at = now + TTL_BY_STATUS[status]
+
+    with database.get_connection() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO tracking_cache (tracking_number, data, expires_at, accessed_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (tracking_number, json.dumps(data), expires_at.isoformat(), now.isoformat()),
+        )
+        conn.execute(
+            """
+            DELETE FROM tracking_cache WHERE tracking_number NOT IN (
+                SELECT tracking_number FROM tracking_cache ORDER BY accessed_at DESC LIMIT ?
+            )
+            """,
+            (MAX_ENTRIES,),
+        )
+        conn.commit()
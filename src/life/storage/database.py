@@ -27,6 +27,14 @@ def init_db() -> None:
                 updated_at TEXT NOT NULL
             )
         """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tracking_cache (
+                tracking_number TEXT PRIMARY KEY,
+                data JSON NOT NULL,
+                expires_at TEXT NOT NULL,
+                accessed_at TEXT NOT NULL
+            )
+        """)
         conn.commit()
 
 
@@ -0,0 +1,17 @@
+import os
+
+os.environ.setdefault("LIFE_SECRET_KEY", "test")
+
+import pytest  # noqa: E402
+
+from life.config import settings  # noqa: E402
+from life.services import tracking  # noqa: E402
+from life.storage import database  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    database.init_db()
+    tracking._in_flight.clear()
+    return tmp_path
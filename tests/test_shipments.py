@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from life.auth import verify_auth
+from life.main import app
+from life.models.shipment import Shipment
+from life.services import tracking
+from life.storage import database
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[verify_auth] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def ship24(monkeypatch):
+    calls = []
+
+    async def fake_fetch(tracking_number: str) -> dict | None:
+        calls.append(tracking_number)
+        return {"shipment": {"statusMilestone": "in_transit"}, "events": []}
+
+    monkeypatch.setattr(tracking, "_fetch_ship24_tracking", fake_fetch)
+    return calls
+
+
+def test_refresh_updates_shipment(client, ship24):
+    shipment = Shipment(carrier="usps", tracking_number="123")
+    database.save("shipments", shipment)
+
+    response = client.post(f"/shipments/{shipment.id}/refresh", follow_redirects=False)
+
+    assert response.status_code == 303
+    assert response.headers["location"] == "/shipments"
+    assert database.load("shipments", shipment.id, Shipment).status == "in_transit"
+    assert ship24 == ["123"]
+
+
+def test_refresh_within_ttl_served_from_cache(client, ship24):
+    shipment = Shipment(carrier="usps", tracking_number="123")
+    database.save("shipments", shipment)
+
+    client.post(f"/shipments/{shipment.id}/refresh", follow_redirects=False)
+    response = client.post(f"/shipments/{shipment.id}/refresh", follow_redirects=False)
+
+    assert response.status_code == 303
+    assert ship24 == ["123"]
+
+
+def test_refresh_unknown_shipment_redirects(client, ship24):
+    response = client.post("/shipments/ship_missing/refresh", follow_redirects=False)
+
+    assert response.status_code == 303
+    assert response.headers["location"] == "/shipments"
+    assert ship24 == []
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from life.models.shipment import Shipment
+from life.services import tracking, tracking_cache
+
+
+def _tracking(milestone: str) -> dict:
+    return {"shipment": {"statusMilestone": milestone}, "events": []}
+
+
+@pytest.fixture
+def ship24(monkeypatch):
+    """Stub the Ship24 call, recording each tracking number requested."""
+    calls = []
+    response = {"value": _tracking("in_transit")}
+
+    async def fake_fetch(tracking_number: str) -> dict | None:
+        calls.append(tracking_number)
+        await asyncio.sleep(0.01)
+        return response["value"]
+
+    monkeypatch.setattr(tracking, "_fetch_ship24_tracking", fake_fetch)
+    return calls, response
+
+
+def test_cache_ttl_depends_on_status(monkeypatch):
+    monkeypatch.setitem(tracking_cache.TTL_BY_STATUS, "out_for_delivery", timedelta(0))
+    tracking_cache.put("1", "out_for_delivery", _tracking("out_for_delivery"))
+    tracking_cache.put("2", "delivered", _tracking("delivered"))
+
+    assert tracking_cache.get("1") is None
+    assert tracking_cache.get("2") == _tracking("delivered")
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(tracking_cache, "MAX_ENTRIES", 3)
+    for number in ["0", "1", "2"]:
+        tracking_cache.put(number, "delivered", {})
+
+    tracking_cache.get("0")
+    tracking_cache.put("3", "delivered", {})
+
+    assert tracking_cache.get("1") is None
+    assert all(tracking_cache.get(number) is not None for number in ["0", "2", "3"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_request(ship24):
+    calls, _ = ship24
+    shipments = [Shipment(carrier="usps", tracking_number="123") for _ in range(5)]
+
+    results = await asyncio.gather(*(tracking.fetch_tracking_status(s) for s in shipments))
+
+    assert [r.status for r in results] == ["in_transit"] * 5
+    assert calls == ["123"]
+    assert tracking._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_fresh_result_served_from_cache(ship24):
+    calls, _ = ship24
+    shipment = Shipment(carrier="usps", tracking_number="123")
+
+    await tracking.fetch_tracking_status(shipment)
+    result = await tracking.fetch_tracking_status(shipment)
+
+    assert result.status == "in_transit"
+    assert calls == ["123"]
+
+
+@pytest.mark.asyncio
+async def test_failed_lookup_not_cached(ship24):
+    calls, response = ship24
+    response["value"] = None
+    shipment = Shipment(carrier="usps", tracking_number="123")
+
+    assert await tracking.fetch_tracking_status(shipment) is None
+    assert tracking_cache.get("123") is None
+    assert await tracking.fetch_tracking_status(shipment) is None
+    assert calls == ["123", "123"]
+
+
+@pytest.mark.asyncio
+async def test_malformed_payload_treated_as_miss(ship24):
+    _, response = ship24
+    response["value"] = {"shipment": None}
+    shipment = Shipment(carrier="usps", tracking_number="123")
+
+    assert await tracking.fetch_tracking_status(shipment) is None
+    assert tracking_cache.get("123") is None
+
+
+@pytest.mark.asyncio
+async def test_payload_failing_to_apply_not_cached(ship24):
+    calls, response = ship24
+    response["value"] = {"shipment": {"statusMilestone": "in_transit", "delivery": None}}
+    shipment = Shipment(carrier="usps", tracking_number="123")
+
+    assert await tracking.fetch_tracking_status(shipment) is None
+    assert tracking_cache.get("123") is None
+    assert await tracking.fetch_tracking_status(shipment) is None
+    assert calls == ["123", "123"]
+
+
+@pytest.mark.asyncio
+async def test_cache_read_error_falls_back_to_live_fetch(ship24, monkeypatch):
+    calls, _ = ship24
+
+    def broken_get(tracking_number: str) -> dict | None:
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(tracking_cache, "get", broken_get)
+    shipment = Shipment(carrier="usps", tracking_number="123")
+
+    result = await tracking.fetch_tracking_status(shipment)
+
+    assert result.status == "in_transit"
+    assert calls == ["123"]